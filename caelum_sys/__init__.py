@@ -1,11 +1,15 @@
 """CaelumSys - Human-friendly system automation toolkit"""
 
-from .auto_import_plugins import load_all_plugins
+from .auto_import_plugins import prewarm_dependencies, register_plugin_stubs
 from .core_actions import do
 from .registry import get_registered_command_phrases
 
-# Auto-load all plugins when package is imported (quiet mode)
-load_all_plugins(verbose=False)
+# Register every plugin command up front; plugin modules (and their heavy
+# dependencies) are only imported the first time one of their commands runs
+register_plugin_stubs()
+
+# Import pyautogui/PIL in the background (disable with CAELUM_NO_PREWARM=1)
+prewarm_dependencies()
 
 __version__ = "0.3.0"
 __author__ = "Joshua Wells"
@@ -1,21 +1,213 @@
 import importlib
+import logging
 import os
-import pathlib
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+PLUGINS_DIR = os.path.join(os.path.dirname(__file__), "plugins")
+MANIFEST_PATH = os.path.join(PLUGINS_DIR, "_manifest.py")
+
+# Heavy third-party modules imported ahead of time by prewarm_dependencies()
+PREWARM_MODULES = ("pyautogui", "PIL.ImageGrab")
+
+
+def discover_plugin_modules():
+    """Scan the plugins directory and return the sorted plugin module names."""
+    modules = []
+    with os.scandir(PLUGINS_DIR) as entries:
+        for entry in entries:
+            # Underscore-prefixed files (__init__, _manifest) are not plugins
+            if (
+                entry.is_file()
+                and entry.name.endswith(".py")
+                and not entry.name.startswith("_")
+            ):
+                modules.append(entry.name[:-3])
+    return sorted(modules)
+
+
+def collect_plugin_commands(module_name):
+    """Import a plugin and return the (phrase, safe) pairs it registers.
+
+    The plugin is really imported (and its register() hook run), so every way
+    of calling register_command is captured. Returns them in registry order.
+    """
+    from caelum_sys.registry import registry
+
+    before = dict(registry)
+    if module_name in sys.modules:
+        # Re-run the decorators of a plugin that is already imported
+        module = importlib.reload(sys.modules[module_name])
+    else:
+        module = importlib.import_module(module_name)
+    if hasattr(module, "register"):
+        module.register()
+
+    return [
+        (phrase, command_data.get("safe", True))
+        for phrase, command_data in registry.items()
+        if before.get(phrase) is not command_data
+    ]
+
+
+def _phrase_literal(phrase):
+    """Return a Python string literal for phrase, double-quoted like black."""
+    literal = repr(phrase)
+    # Without quotes in the phrase, swapping repr's delimiters is always valid
+    if "'" not in phrase and '"' not in phrase:
+        literal = f'"{literal[1:-1]}"'
+    return literal
+
+
+def rebuild_manifest():
+    """Regenerate plugins/_manifest.py from the plugins directory (dev only).
+
+    Every plugin is imported to record the commands it registers, so all
+    plugin dependencies must be installed.
+
+    Raises:
+        RuntimeError: If a plugin can't be imported
+    """
+    modules = discover_plugin_modules()
+
+    commands = {}
+    for name in modules:
+        try:
+            commands[name] = collect_plugin_commands(f"caelum_sys.plugins.{name}")
+        except ImportError as e:
+            raise RuntimeError(
+                f"Cannot rebuild manifest: plugin '{name}' failed to import ({e}). "
+                "Install all plugin dependencies first."
+            ) from e
+
+    lines = [
+        '"""Plugin manifest generated by `caelum-sys --rebuild-manifest`."""',
+        "",
+        "# Do not edit by hand - rerun the command after adding or removing a plugin",
+        "MODULES = (",
+    ]
+    lines.extend(f'    "{name}",' for name in modules)
+    lines.append(")")
+    lines.append("")
+    lines.append("# Command phrases and safety flags registered by each plugin")
+    lines.append("COMMANDS = {")
+    for name in modules:
+        lines.append(f'    "{name}": [')
+        lines.extend(
+            f"        ({_phrase_literal(phrase)}, {safe}),"
+            for phrase, safe in commands[name]
+        )
+        lines.append("    ],")
+    lines.append("}")
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    return modules
+
+
+def register_plugin_stubs():
+    """Register every plugin command from the manifest without importing plugins.
+
+    Each phrase gets a lazy placeholder that imports its plugin on first use.
+    Plugins that are already imported and phrases that are already registered
+    are left alone. Falls back to eagerly loading all plugins if the manifest
+    is unavailable.
+    """
+    try:
+        from caelum_sys.plugins._manifest import COMMANDS, MODULES
+    except ImportError:
+        load_all_plugins()
+        return
+
+    from caelum_sys.registry import register_lazy_command, registry
+
+    for name in MODULES:
+        module_name = f"caelum_sys.plugins.{name}"
+        if module_name in sys.modules:
+            continue
+        for phrase, safe in COMMANDS.get(name, ()):
+            if phrase not in registry:
+                register_lazy_command(phrase, module_name, safe=safe)
+
+
+def _try_import(module_name):
+    try:
+        return importlib.import_module(module_name), None
+    except ImportError as e:
+        return None, e
 
 
 def load_all_plugins(verbose: bool = False):
-    plugins_dir = pathlib.Path(__file__).parent / "plugins"
-
-    for file in os.listdir(plugins_dir):
-        if file.endswith(".py") and not file.startswith("__"):
-            module_name = f"caelum_sys.plugins.{file[:-3]}"
-            try:
-                module = importlib.import_module(module_name)
-                if verbose:
-                    print(f"🔌 Loaded plugin: {module_name}")
-                # Ensure the plugin is registered (if it has a register function)
-                if hasattr(module, "register"):
-                    module.register()
-            except ImportError as e:
-                if verbose:
-                    print(f"⚠️ Failed to load plugin '{file[:-3]}': {e}")
+    # Only needed here; keeps it off the lazy `import caelum_sys` path
+    import concurrent.futures
+
+    try:
+        from caelum_sys.plugins._manifest import MODULES
+    except ImportError:
+        # Fall back to scanning when the manifest hasn't been generated yet
+        MODULES = discover_plugin_modules()
+    else:
+        # Plugins register from worker threads below; seeding placeholders in
+        # manifest order first keeps the registry order deterministic
+        register_plugin_stubs()
+
+    # Module imports are thread-safe, so overlap their disk I/O
+    module_names = [f"caelum_sys.plugins.{name}" for name in MODULES]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_try_import, module_names))
+
+    loaded = []
+    failed = []
+    for name, (module, error) in zip(MODULES, results):
+        if module is None:
+            failed.append(f"{name} ({error})")
+            continue
+        # Ensure the plugin is registered (if it has a register function);
+        # done here on the calling thread rather than in the workers
+        if hasattr(module, "register"):
+            module.register()
+        loaded.append(name)
+
+    # One summary instead of a line per plugin keeps imports quiet and fast
+    logger.debug("Loaded %d plugins: %s", len(loaded), ", ".join(loaded))
+    if failed:
+        logger.debug("Failed to load %d plugins: %s", len(failed), "; ".join(failed))
+    if verbose:
+        print(f"🔌 Loaded {len(loaded)} plugins ({len(failed)} failed)")
+        for failure in failed:
+            print(f"⚠️ Failed to load plugin {failure}")
+
+
+def _import_quietly(module_names):
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # Missing or display-less dependencies are reported by the plugin
+            pass
+
+
+def prewarm_dependencies():
+    """Start importing heavy plugin dependencies in a background thread.
+
+    This hides pyautogui/PIL import latency behind user think-time so the
+    first media or screenshot command doesn't pay it. Set the environment
+    variable CAELUM_NO_PREWARM=1 to disable it (e.g. for library consumers).
+
+    Returns:
+        The started daemon thread, or None if pre-warming is disabled
+    """
+    if os.environ.get("CAELUM_NO_PREWARM", "") not in ("", "0"):
+        return None
+
+    thread = threading.Thread(
+        target=_import_quietly,
+        args=(PREWARM_MODULES,),
+        name="caelum-prewarm",
+        daemon=True,
+    )
+    thread.start()
+    return thread
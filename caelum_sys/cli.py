@@ -11,6 +11,14 @@ def main():
         print('Usage: caelum-sys "<command>"')
         return
 
+    # Developer-only: regenerate the plugin manifest after adding/removing plugins
+    if sys.argv[1] == "--rebuild-manifest":
+        from .auto_import_plugins import rebuild_manifest
+
+        modules = rebuild_manifest()
+        print(f"📝 Plugin manifest rebuilt with {len(modules)} plugins.")
+        return
+
     command = " ".join(sys.argv[1:])
     result = do(command)
     print(result)
@@ -1,5 +1,6 @@
 """Core Actions Module - Main Command Execution Engine"""
 
+import functools
 import inspect
 import re
 
@@ -9,43 +10,124 @@ from caelum_sys.registry import get_registered_command
 
 def extract_arguments_from_user_input(user_input: str, command_template: str):
     """Extract argument values from user input based on command template."""
-    escaped_template = re.escape(command_template)
-    placeholders = re.findall(r"\{(\w+)\}", command_template)
+    pattern = registry.get_command_pattern(command_template)
+    if pattern is None:
+        return {}
 
-    pattern = escaped_template
-    for placeholder in placeholders:
-        escaped_placeholder = re.escape(f"{{{placeholder}}}")
-        pattern = pattern.replace(escaped_placeholder, r"(.+?)")
-
-    pattern = f"^{pattern}$"
-    match = re.match(pattern, user_input, re.IGNORECASE)
+    match = pattern.match(user_input)
     if match:
-        args = {}
-        for i, placeholder in enumerate(placeholders):
-            args[placeholder] = match.group(i + 1).strip()
-        return args
+        placeholders = registry.get_placeholder_names(command_template)
+        return {
+            placeholder: value.strip()
+            for placeholder, value in zip(placeholders, match.groups())
+        }
 
     return {}
 
 
-def find_matching_command_template(user_input: str):
-    """Find which registered command template matches the user input."""
-    registered_commands = list(registry.registry.keys())
+# (compiled regex, templates by group index) for all parameterized
+# templates; rebuilt lazily after the registry changes
+_template_regex = None
+
+
+def _get_template_regex():
+    """Build one alternation regex covering every parameterized template.
+
+    Each template becomes a single capturing group (its placeholders are
+    non-capturing), so match.lastindex identifies which template matched.
+    Alternation tries branches in registry order, giving the same
+    first-match-wins result as scanning the templates one by one.
+    """
+    global _template_regex
+    if _template_regex is not None:
+        return _template_regex
+
+    branches = []
+    templates = {}
+    for command_template in list(registry.registry):
+        if command_template not in registry.parameterized_phrases:
+            continue
+        source = registry.command_pattern_source(command_template, capture=False)
+        branches.append(f"({source})")
+        templates[len(branches)] = command_template
 
-    for command_template in registered_commands:
-        if "{" in command_template:
-            args = extract_arguments_from_user_input(user_input, command_template)
-            if args:
-                return command_template, args
+    # "$" (not fullmatch) so a trailing newline is tolerated, as before
+    regex = re.compile(f"(?:{'|'.join(branches)})$", re.IGNORECASE)
+    _template_regex = (regex, templates)
+    return _template_regex
 
+
+def _reset_template_regex():
+    global _template_regex
+    _template_regex = None
+
+
+@functools.lru_cache(maxsize=2048)
+def find_matching_command_template(user_input: str):
+    """Find which registered command template matches the user input.
+
+    Results are memoized per input; the cache is cleared whenever the
+    registry changes. Treat the returned args dict as read-only.
+    """
+    regex, templates = _get_template_regex()
+    if not templates:
+        # An empty alternation would match "" with no template group
+        return None, {}
+    match = regex.match(user_input)
+    if not match or match.lastindex is None:
+        return None, {}
+
+    # Re-run the winning template's own pattern to pull out its arguments
+    command_template = templates[match.lastindex]
+    return command_template, extract_arguments_from_user_input(
+        user_input, command_template
+    )
+
+
+# Registering or clearing commands can change which template an input matches
+registry.on_registry_change(find_matching_command_template.cache_clear)
+registry.on_registry_change(_reset_template_regex)
+
+# Template matched by the last parameterized command; scripts tend to repeat
+# the same command, so do() tries it before the full template search
+_last_template = None
+
+
+def _match_last_template(command: str):
+    """Try the most recently matched template against the input first."""
+    template = _last_template
+    if template is None or template not in registry.registry:
+        return None, {}
+
+    args = extract_arguments_from_user_input(command, template)
+    if args and all(args.values()):
+        return template, args
     return None, {}
 
 
+def _lookup_direct_command(command: str):
+    """Look up an exact command phrase, ignoring case and surrounding spaces.
+
+    Returns (is_template, func): is_template is True when the input is a
+    parameterized phrase typed literally (e.g. "get file size {path}"),
+    which must not run with the brace text as its argument. func is the
+    argument-free command function, or None.
+    """
+    key = command.strip().lower()
+    if key in registry.parameterized_phrases:
+        return True, None
+    command_data = registry.registry.get(key)
+    return False, command_data["func"] if command_data is not None else None
+
+
 def do(command: str):
     """Execute a CaelumSys command and return the result."""
 
-    # Try direct match for simple commands
-    plugin_func = get_registered_command(command)
+    # Fast path: an exact, argument-free phrase is a single dict lookup;
+    # everything else goes to templates
+    is_template, plugin_func = _lookup_direct_command(command)
+    if is_template:
+        return f"❌ '{command.strip()}' needs values for its {{placeholders}}"
     if plugin_func:
         try:
             result = plugin_func()
@@ -53,8 +135,13 @@ def do(command: str):
         except Exception as e:
             return f"❌ Error executing '{command}': {e}"
 
-    # Try parameterized commands
-    command_template, args = find_matching_command_template(command)
+    # Try parameterized commands, starting with the last template that matched
+    global _last_template
+    command_template, args = _match_last_template(command)
+    if command_template is None:
+        command_template, args = find_matching_command_template(command)
+        if command_template:
+            _last_template = command_template
     if command_template:
         plugin_func = get_registered_command(command_template)
         if plugin_func:
@@ -96,8 +183,11 @@ def list_all_commands():
 
 def validate_command(command: str):
     """Check if a command is valid without executing it."""
-    # Check for direct match
-    if get_registered_command(command):
+    # Check for direct match, normalized the same way do() does it
+    is_template, plugin_func = _lookup_direct_command(command)
+    if is_template:
+        return {"valid": False, "error": "Command needs values for its placeholders"}
+    if plugin_func:
         return {"valid": True, "type": "direct", "command": command, "args": {}}
 
     # Check for parameterized match
@@ -107,7 +197,7 @@ def validate_command(command: str):
             "valid": True,
             "type": "parameterized",
             "template": template,
-            "args": args,
+            "args": dict(args),
         }
 
     return {"valid": False, "error": "Command not recognized"}
@@ -68,6 +68,9 @@ def load_plugins():
     # Iterate through all modules in this package directory
     # pkgutil.iter_modules scans for .py files in __path__ (current directory)
     for _, module_name, _ in pkgutil.iter_modules(__path__):
+        # Skip private helper modules such as _manifest
+        if module_name.startswith("_"):
+            continue
         try:
             # Dynamically import the module
             # This triggers any @register_command decorators in the module
@@ -88,6 +91,30 @@ def load_plugins():
             continue
 
 
+def __getattr__(name):
+    """
+    Import plugin submodules lazily on attribute access (PEP 562).
+
+    Plugins are no longer imported when caelum_sys is imported, so this keeps
+    attribute-style access such as ``caelum_sys.plugins.media_controls``
+    working by importing the module on first use.
+
+    Raises:
+        AttributeError: If no plugin module with that name exists
+    """
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    full_module_name = f"{__name__}.{name}"
+    try:
+        return importlib.import_module(full_module_name)
+    except ModuleNotFoundError as e:
+        # Only translate "no such plugin"; missing plugin dependencies propagate
+        if e.name != full_module_name:
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
 def get_plugin_info():
     """
     Get information about available plugins in the plugins directory.
@@ -103,7 +130,8 @@ def get_plugin_info():
     plugins = []
 
     for _, module_name, ispkg in pkgutil.iter_modules(__path__):
-        if not ispkg:  # Only include modules, not sub-packages
+        # Only include modules, not sub-packages or private helpers
+        if not ispkg and not module_name.startswith("_"):
             plugins.append(
                 {
                     "name": module_name,
@@ -0,0 +1,186 @@
+"""Plugin manifest generated by `caelum-sys --rebuild-manifest`."""
+
+# Do not edit by hand - rerun the command after adding or removing a plugin
+MODULES = (
+    "caelum_control",
+    "data_processing",
+    "date_time",
+    "dev_tools",
+    "file_info",
+    "file_management",
+    "git_integration",
+    "help_system",
+    "math_calculations",
+    "media_controls",
+    "misc_commands",
+    "monitoring_tools",
+    "network_tools",
+    "process_tools",
+    "quick_notes",
+    "screenshot_tools",
+    "system_utils",
+    "text_clipboard",
+    "web_api",
+    "windows_tools",
+)
+
+# Command phrases and safety flags registered by each plugin
+COMMANDS = {
+    "caelum_control": [
+        ("list available commands", True),
+    ],
+    "data_processing": [
+        ("convert json to csv", True),
+        ("encode base64", True),
+        ("decode base64", True),
+        ("generate uuid", True),
+        ("hash text with md5", True),
+        ("hash text with sha256", True),
+        ("validate json", True),
+        ("format json", True),
+        ("extract json keys", True),
+        ("url encode text", True),
+        ("url decode text", True),
+    ],
+    "date_time": [
+        ("get current timestamp", True),
+        ("what time is it in {timezone}", True),
+        ("how many days until {date}", True),
+        ("add {days} days to today", True),
+        ("set timer for {minutes} minutes", True),
+        ("convert timestamp {timestamp}", True),
+        ("get day of week for {date}", True),
+        ("format date {date} as {format}", True),
+    ],
+    "dev_tools": [
+        ("open vs code", True),
+        ("list installed packages", True),
+    ],
+    "file_info": [
+        ("get file size {path}", True),
+        ("check if file exists {path}", True),
+        ("get file extension {path}", True),
+        ("count lines in file {path}", True),
+        ("get file info {path}", True),
+        ("get file hash {path}", True),
+        ("find files with extension {ext} in {directory}", True),
+    ],
+    "file_management": [
+        ("create file at {path}", True),
+        ("delete file at {path}", True),
+        ("copy file {source} to {destination}", True),
+        ("move file {source} to {destination}", True),
+        ("list files in {directory}", True),
+        ("create directory at {path}", True),
+    ],
+    "git_integration": [
+        ("git status", True),
+        ("git add all files", False),
+        ("git commit with message {message}", False),
+        ("git push", False),
+        ("git pull", False),
+        ("create new branch {name}", False),
+        ("switch to branch {name}", False),
+        ("list git branches", True),
+        ("get current branch", True),
+        ("git log last {count} commits", True),
+        ("check git remote", True),
+    ],
+    "help_system": [
+        ("help", True),
+        ("list safe commands", True),
+        ("list unsafe commands", True),
+        ("search commands for {keyword}", True),
+    ],
+    "math_calculations": [
+        ("calculate", True),
+        ("generate random number between {min_val} and {max_val}", True),
+        ("convert temperature {value} {from_unit} to {to_unit}", True),
+        ("convert length {value} {from_unit} to {to_unit}", True),
+        ("convert weight {value} {from_unit} to {to_unit}", True),
+        ("calculate percentage {part} of {whole}", True),
+        ("calculate tip {bill} at {percentage} percent", True),
+    ],
+    "media_controls": [
+        ("pause music", True),
+        ("mute volume", True),
+        ("volume up", True),
+        ("volume down", True),
+        ("next track", True),
+        ("previous track", True),
+        ("open media player", True),
+    ],
+    "misc_commands": [
+        ("get current time", True),
+        ("get system info", True),
+        ("say hello", True),
+        ("get python version", True),
+    ],
+    "monitoring_tools": [
+        ("start cpu monitor", True),
+        ("start memory monitor", True),
+        ("start disk monitor", True),
+    ],
+    "network_tools": [
+        ("get my ip address", True),
+        ("ping {host}", True),
+        ("get hostname", True),
+        ("resolve dns for {domain}", True),
+        ("open browser at {url}", True),
+    ],
+    "process_tools": [
+        ("list running processes", True),
+        ("kill process by name {name}", False),
+        ("get cpu usage", True),
+        ("get memory usage", True),
+    ],
+    "quick_notes": [
+        ("save note {text}", True),
+        ("list all notes", True),
+        ("get note {note_id}", True),
+        ("search notes for {keyword}", True),
+        ("delete note {note_id}", False),
+        ("update note {note_id} with {new_text}", False),
+        ("count notes", True),
+    ],
+    "screenshot_tools": [
+        ("take screenshot", True),
+        ("take screenshot with delay", True),
+        ("take screenshot with region", True),
+        ("take screenshot with custom filename", True),
+        ("take screenshot with custom format", True),
+    ],
+    "system_utils": [
+        ("lock screen", False),
+        ("shut down in 5 minutes", False),
+        ("restart in 5 minutes", False),
+        ("hibernate", False),
+        ("clear temp files", False),
+    ],
+    "text_clipboard": [
+        ("copy text to clipboard", True),
+        ("get clipboard content", True),
+        ("clear clipboard", True),
+        ("append to clipboard", True),
+        ("count words in text", True),
+        ("reverse text", True),
+        ("uppercase text", True),
+        ("lowercase text", True),
+    ],
+    "web_api": [
+        ("search web for {query}", True),
+        ("check website status {url}", True),
+        ("get page title from {url}", True),
+        ("download file from {url}", False),
+        ("shorten url {url}", True),
+        ("get my public ip", True),
+        ("get weather for {city}", True),
+    ],
+    "windows_tools": [
+        ("open task manager", True),
+        ("open file explorer", True),
+        ("lock workstation", True),
+        ("open control panel", True),
+        ("open device manager", True),
+    ],
+}
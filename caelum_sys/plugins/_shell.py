@@ -0,0 +1,14 @@
+"""Shared helpers for plugins that run external programs."""
+
+import functools
+import shutil
+
+
+@functools.lru_cache(maxsize=None)
+def which(name):
+    """Locate an executable on PATH, caching the answer for the process.
+
+    Lets plugins skip spawning a shell or process for tools that aren't
+    installed. A tool installed after the first lookup needs a restart.
+    """
+    return shutil.which(name)
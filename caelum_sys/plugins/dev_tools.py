@@ -1,3 +1,4 @@
+from caelum_sys.plugins._shell import which
 from caelum_sys.registry import register_command
 
 
@@ -5,8 +6,11 @@ from caelum_sys.registry import register_command
 def open_vs_code():
     import subprocess
 
+    code = which("code")
+    if code is None:
+        return "❌ VS Code ('code') not found in PATH."
     try:
-        subprocess.Popen("code")  # Assumes VS Code is in PATH
+        subprocess.Popen([code])
         return "🧑‍💻 VS Code opened."
     except Exception as e:
         return f"❌ Failed to open VS Code: {e}"
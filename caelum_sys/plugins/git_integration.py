@@ -5,14 +5,22 @@ Git integration plugin for version control operations and repository management.
 import os
 import subprocess
 
+from caelum_sys.plugins._shell import which
 from caelum_sys.registry import register_command
 
 
-def _run_git_command(command):
-    """Helper function to run git commands safely."""
+def _run_git_command(*args):
+    """Helper function to run git commands safely.
+
+    Arguments are passed to git as a list, without a shell, so user input
+    such as branch names and commit messages is never interpreted.
+    """
+    git = which("git")
+    if git is None:
+        return False, "", "git is not installed or not in PATH"
     try:
         result = subprocess.run(
-            command, shell=True, capture_output=True, text=True, cwd=os.getcwd()
+            [git, *args], capture_output=True, text=True, cwd=os.getcwd()
         )
         return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
     except Exception as e:
@@ -22,7 +30,7 @@ def _run_git_command(command):
 @register_command("git status", safe=True)
 def git_status():
     """Get the current git repository status."""
-    success, stdout, stderr = _run_git_command("git status --porcelain")
+    success, stdout, stderr = _run_git_command("status", "--porcelain")
 
     if not success:
         return f"❌ Git error: {stderr or 'Not a git repository or git not installed'}"
@@ -52,7 +60,7 @@ def git_status():
 @register_command("git add all files", safe=False)
 def git_add_all():
     """Add all changes to git staging area."""
-    success, stdout, stderr = _run_git_command("git add .")
+    success, stdout, stderr = _run_git_command("add", ".")
 
     if success:
         return "✅ All changes added to staging area"
@@ -63,9 +71,7 @@ def git_add_all():
 @register_command("git commit with message {message}", safe=False)
 def git_commit(message: str):
     """Commit staged changes with a message."""
-    # Escape quotes in commit message
-    escaped_message = message.replace('"', '\\"')
-    success, stdout, stderr = _run_git_command(f'git commit -m "{escaped_message}"')
+    success, stdout, stderr = _run_git_command("commit", "-m", message)
 
     if success:
         return f"✅ Committed changes: {message}"
@@ -76,7 +82,7 @@ def git_commit(message: str):
 @register_command("git push", safe=False)
 def git_push():
     """Push commits to remote repository."""
-    success, stdout, stderr = _run_git_command("git push")
+    success, stdout, stderr = _run_git_command("push")
 
     if success:
         return "✅ Successfully pushed to remote repository"
@@ -87,7 +93,7 @@ def git_push():
 @register_command("git pull", safe=False)
 def git_pull():
     """Pull latest changes from remote repository."""
-    success, stdout, stderr = _run_git_command("git pull")
+    success, stdout, stderr = _run_git_command("pull")
 
     if success:
         if "Already up to date" in stdout:
@@ -101,7 +107,7 @@ def git_pull():
 @register_command("create new branch {name}", safe=False)
 def create_branch(name: str):
     """Create and switch to a new git branch."""
-    success, stdout, stderr = _run_git_command(f"git checkout -b {name}")
+    success, stdout, stderr = _run_git_command("checkout", "-b", name)
 
     if success:
         return f"✅ Created and switched to new branch: {name}"
@@ -112,7 +118,7 @@ def create_branch(name: str):
 @register_command("switch to branch {name}", safe=False)
 def switch_branch(name: str):
     """Switch to an existing git branch."""
-    success, stdout, stderr = _run_git_command(f"git checkout {name}")
+    success, stdout, stderr = _run_git_command("checkout", name)
 
     if success:
         return f"✅ Switched to branch: {name}"
@@ -123,7 +129,7 @@ def switch_branch(name: str):
 @register_command("list git branches", safe=True)
 def list_branches():
     """List all git branches."""
-    success, stdout, stderr = _run_git_command("git branch")
+    success, stdout, stderr = _run_git_command("branch")
 
     if not success:
         return f"❌ Git error: {stderr}"
@@ -148,7 +154,7 @@ def list_branches():
 @register_command("get current branch", safe=True)
 def get_current_branch():
     """Get the name of the current git branch."""
-    success, stdout, stderr = _run_git_command("git branch --show-current")
+    success, stdout, stderr = _run_git_command("branch", "--show-current")
 
     if success and stdout:
         return f"🌿 Current branch: {stdout}"
@@ -162,7 +168,7 @@ def git_log(count: int = 5):
     if count > 20:
         count = 20  # Limit to prevent spam
 
-    success, stdout, stderr = _run_git_command(f"git log --oneline -n {count}")
+    success, stdout, stderr = _run_git_command("log", "--oneline", "-n", str(count))
 
     if not success:
         return f"❌ Git log failed: {stderr}"
@@ -176,7 +182,7 @@ def git_log(count: int = 5):
 @register_command("check git remote", safe=True)
 def check_remote():
     """Check git remote repository information."""
-    success, stdout, stderr = _run_git_command("git remote -v")
+    success, stdout, stderr = _run_git_command("remote", "-v")
 
     if not success:
         return f"❌ Git error: {stderr}"
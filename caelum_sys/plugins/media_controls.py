@@ -2,35 +2,40 @@
 Media controls plugin for volume and playback control via keyboard shortcuts.
 """
 
-import os  # For executing system commands
-
-try:
-    # Only try to import pyautogui if we're in a GUI environment or can safely handle headless
-    if (
-        os.environ.get("DISPLAY")
-        or os.name == "nt"
-        or os.environ.get("PYTEST_CURRENT_TEST")
-    ):
-        import pyautogui  # For sending keyboard shortcuts to control media
-    else:
-        # Try importing anyway but catch any display-related errors
-        import pyautogui  # For sending keyboard shortcuts to control media
-    MEDIA_CONTROLS_AVAILABLE = True
-except (ImportError, Exception):
-    # Catch both import errors and any display-related exceptions
-    pyautogui = None  # type: ignore
-    MEDIA_CONTROLS_AVAILABLE = False
+import functools  # For caching the pyautogui import probe
+import subprocess  # For running nircmd without a shell
 
+from caelum_sys.plugins._shell import which
 from caelum_sys.registry import register_command
 
+# Key presses pass _pause=False: pyautogui otherwise sleeps pyautogui.PAUSE
+# (0.1s) after every call, which a single media key doesn't need
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pyautogui():
+    """Import pyautogui on first use, returning None if it can't be loaded.
+
+    Importing here rather than at module level lets the package's background
+    pre-warm thread pay pyautogui's import cost before the first command.
+    The result, including a failed import, is cached for the process.
+    """
+    try:
+        import pyautogui  # For sending keyboard shortcuts to control media
+    except Exception:
+        # Catch both import errors and any display-related exceptions
+        return None
+    return pyautogui
+
 
 @register_command("pause music")
 def pause_music():
     """Toggle play/pause for the currently active media player."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return "❌ Media controls not available on this system"
     try:
-        pyautogui.press("playpause")
+        pyautogui.press("playpause", _pause=False)
         return "⏸️ Toggled play/pause."
     except Exception as e:
         return f"❌ Failed to control media: {e}"
@@ -39,11 +44,20 @@ def pause_music():
 @register_command("mute volume")
 def mute_volume():
     """Toggle system volume mute on/off."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    # Prefer nircmd (Windows) when installed; doing both would toggle mute twice
+    nircmd = which("nircmd")
+    if nircmd:
+        try:
+            subprocess.run([nircmd, "mutesysvolume", "toggle"], check=False)
+            return "🔇 Volume muted/unmuted."
+        except Exception as e:
+            return f"❌ Failed to control volume: {e}"
+
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return "❌ Media controls not available on this system"
     try:
-        pyautogui.press("volumemute")
-        os.system("nircmd mutesysvolume toggle")  # Optional nircmd support
+        pyautogui.press("volumemute", _pause=False)
         return "🔇 Volume muted/unmuted."
     except Exception as e:
         return f"❌ Failed to control volume: {e}"
@@ -52,10 +66,11 @@ def mute_volume():
 @register_command("volume up")
 def volume_up():
     """Increase the system volume by one step."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return "❌ Media controls not available on this system"
     try:
-        pyautogui.press("volumeup")
+        pyautogui.press("volumeup", _pause=False)
         return "🔊 Volume increased."
     except Exception as e:
         return f"❌ Failed to increase volume: {e}"
@@ -64,10 +79,11 @@ def volume_up():
 @register_command("volume down")
 def volume_down():
     """Decrease the system volume by one step."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return "❌ Media controls not available on this system"
     try:
-        pyautogui.press("volumedown")
+        pyautogui.press("volumedown", _pause=False)
         return "🔉 Volume decreased."
     except Exception as e:
         return f"❌ Failed to decrease volume: {e}"
@@ -76,10 +92,11 @@ def volume_down():
 @register_command("next track")
 def next_track():
     """Skip to the next track in the currently playing media."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return "❌ Media controls not available on this system"
     try:
-        pyautogui.press("nexttrack")
+        pyautogui.press("nexttrack", _pause=False)
         return "⏭️ Skipped to next track."
     except Exception as e:
         return f"❌ Failed to skip track: {e}"
@@ -88,10 +105,11 @@ def next_track():
 @register_command("previous track")
 def previous_track():
     """Go back to the previous track in the currently playing media."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return "❌ Media controls not available on this system"
     try:
-        pyautogui.press("prevtrack")
+        pyautogui.press("prevtrack", _pause=False)
         return "⏮️ Went to previous track."
     except Exception as e:
         return f"❌ Failed to go to previous track: {e}"
@@ -100,10 +118,11 @@ def previous_track():
 @register_command("open media player")
 def open_media_player():
     """Open or activate a media player."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return "❌ Media controls not available on this system"
     try:
-        pyautogui.press("playpause")
+        pyautogui.press("playpause", _pause=False)
         return "🎵 Media player toggled (or opened if already running)."
     except Exception as e:
         return f"❌ Failed to open media player: {e}"
@@ -114,7 +133,8 @@ def open_media_player():
 
 def _check_media_keys_support():
     """Check if the system supports media keys."""
-    if not MEDIA_CONTROLS_AVAILABLE or pyautogui is None:
+    pyautogui = _get_pyautogui()
+    if pyautogui is None:
         return False
     try:
         return hasattr(pyautogui, "press") and "playpause" in pyautogui.KEYBOARD_KEYS
@@ -5,6 +5,7 @@ Network tools plugin for basic connectivity and DNS operations.
 import socket
 import subprocess
 
+from caelum_sys.plugins._shell import which
 from caelum_sys.registry import register_command
 
 
@@ -18,8 +19,11 @@ def get_ip_address():
 @register_command("ping {host}")
 def ping_host(host: str):
     """Ping a host to test connectivity (4 packets)."""
+    ping = which("ping")
+    if ping is None:
+        return "❌ ping is not available on this system."
     try:
-        output = subprocess.check_output(["ping", "-n", "4", host], text=True)
+        output = subprocess.check_output([ping, "-n", "4", host], text=True)
         return f"📡 Ping results for {host}:\n{output}"
     except subprocess.CalledProcessError:
         return f"❌ Failed to ping {host}."
@@ -2,37 +2,64 @@
 Screenshot tools plugin for capturing screen content in various formats and regions.
 """
 
+import functools
 import os
-
-try:
-    # Only try to import pyautogui if we're in a GUI environment or can safely handle headless
-    if (
-        os.environ.get("DISPLAY")
-        or os.name == "nt"
-        or os.environ.get("PYTEST_CURRENT_TEST")
-    ):
-        import pyautogui
-    else:
-        # Try importing anyway but catch any display-related errors
-        import pyautogui
-    SCREENSHOT_AVAILABLE = True
-except (ImportError, Exception):
-    # Catch both import errors and any display-related exceptions
-    pyautogui = None  # type: ignore
-    SCREENSHOT_AVAILABLE = False
+import time
 
 from caelum_sys.registry import register_command
 
+# Screenshots are usually throwaway, so favour encoding speed over file size:
+# zlib level 1 roughly halves PNG encode time versus Pillow's default
+PNG_COMPRESS_LEVEL = 1
+JPEG_QUALITY = 85
+
+# Static result messages, built once at import
+_MSG_UNAVAILABLE = "❌ Screenshot functionality not available on this system"
+_MSG_SCREENSHOT = "📸 Screenshot saved as 'screenshot.png'."
+_MSG_REGION = "📸 Region screenshot saved as 'screenshot_region.png'."
+
+
+@functools.lru_cache(maxsize=None)
+def _get_image_grab():
+    """Return PIL's ImageGrab module, or None if screen capture isn't available.
+
+    pyautogui.screenshot() is a thin wrapper around ImageGrab.grab(); calling
+    it directly skips pyautogui's per-call overhead. Cached, so a failed
+    import isn't retried on every screenshot command.
+    """
+    try:
+        from PIL import ImageGrab
+    except Exception:
+        return None
+    return ImageGrab
+
+
+def _save_screenshot(
+    screenshot, filename, compress_level=PNG_COMPRESS_LEVEL, quality=JPEG_QUALITY
+):
+    """Save a screenshot using fast encoder settings for its file format."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".png":
+        screenshot.save(filename, optimize=False, compress_level=compress_level)
+    elif extension in (".jpg", ".jpeg"):
+        screenshot.save(filename, quality=quality)
+    else:
+        screenshot.save(filename)
+
 
 @register_command("take screenshot")
-def take_screenshot():
-    """Take a full-screen screenshot and save as 'screenshot.png'."""
-    if not SCREENSHOT_AVAILABLE or pyautogui is None:
-        return "❌ Screenshot functionality not available on this system"
+def take_screenshot(compress_level: int = PNG_COMPRESS_LEVEL):
+    """Take a full-screen screenshot and save as 'screenshot.png'.
+
+    Pass a higher compress_level (up to 9) for smaller but slower PNGs.
+    """
+    ImageGrab = _get_image_grab()
+    if ImageGrab is None:
+        return _MSG_UNAVAILABLE
     try:
-        screenshot = pyautogui.screenshot()
-        screenshot.save("screenshot.png")
-        return "📸 Screenshot saved as 'screenshot.png'."
+        screenshot = ImageGrab.grab()
+        _save_screenshot(screenshot, "screenshot.png", compress_level=compress_level)
+        return _MSG_SCREENSHOT
     except Exception as e:
         return f"❌ Failed to take screenshot: {e}"
 
@@ -40,12 +67,13 @@ def take_screenshot():
 @register_command("take screenshot with delay")
 def take_screenshot_with_delay(seconds: int = 3):
     """Take a screenshot after a specified delay."""
-    if not SCREENSHOT_AVAILABLE or pyautogui is None:
-        return "❌ Screenshot functionality not available on this system"
+    ImageGrab = _get_image_grab()
+    if ImageGrab is None:
+        return _MSG_UNAVAILABLE
     try:
-        pyautogui.sleep(seconds)
-        screenshot = pyautogui.screenshot()
-        screenshot.save("screenshot_delayed.png")
+        time.sleep(seconds)
+        screenshot = ImageGrab.grab()
+        _save_screenshot(screenshot, "screenshot_delayed.png")
         return f"📸 Screenshot taken after {seconds}s delay. Saved as 'screenshot_delayed.png'."
     except Exception as e:
         return f"❌ Failed to take delayed screenshot: {e}"
@@ -56,13 +84,15 @@ def take_screenshot_with_region(
     x: int = 100, y: int = 100, width: int = 300, height: int = 300
 ):
     """Take a screenshot of a specific rectangular region."""
-    if not SCREENSHOT_AVAILABLE or pyautogui is None:
-        return "❌ Screenshot functionality not available on this system"
+    ImageGrab = _get_image_grab()
+    if ImageGrab is None:
+        return _MSG_UNAVAILABLE
     try:
-        region = (x, y, width, height)
-        screenshot = pyautogui.screenshot(region=region)
-        screenshot.save("screenshot_region.png")
-        return "📸 Region screenshot saved as 'screenshot_region.png'."
+        # ImageGrab takes corner coordinates, not pyautogui's (x, y, w, h)
+        bbox = (x, y, x + width, y + height)
+        screenshot = ImageGrab.grab(bbox=bbox)
+        _save_screenshot(screenshot, "screenshot_region.png")
+        return _MSG_REGION
     except Exception as e:
         return f"❌ Failed to take region screenshot: {e}"
 
@@ -70,25 +100,29 @@ def take_screenshot_with_region(
 @register_command("take screenshot with custom filename")
 def take_screenshot_with_custom_filename(filename: str = "custom_screenshot.png"):
     """Take a screenshot with a user-specified filename."""
-    if not SCREENSHOT_AVAILABLE or pyautogui is None:
-        return "❌ Screenshot functionality not available on this system"
+    ImageGrab = _get_image_grab()
+    if ImageGrab is None:
+        return _MSG_UNAVAILABLE
     try:
-        screenshot = pyautogui.screenshot()
-        screenshot.save(filename)
+        screenshot = ImageGrab.grab()
+        _save_screenshot(screenshot, filename)
         return f"📸 Screenshot saved as '{filename}'."
     except Exception as e:
         return f"❌ Failed to take screenshot: {e}"
 
 
 @register_command("take screenshot with custom format")
-def take_screenshot_with_custom_format(format: str = "png"):
-    """Take a screenshot and save in specified format."""
-    if not SCREENSHOT_AVAILABLE or pyautogui is None:
-        return "❌ Screenshot functionality not available on this system"
+def take_screenshot_with_custom_format(
+    format: str = "png", quality: int = JPEG_QUALITY
+):
+    """Take a screenshot and save in specified format (quality applies to JPEG)."""
+    ImageGrab = _get_image_grab()
+    if ImageGrab is None:
+        return _MSG_UNAVAILABLE
     try:
         filename = f"screenshot_custom.{format}"
-        screenshot = pyautogui.screenshot()
-        screenshot.save(filename)
+        screenshot = ImageGrab.grab()
+        _save_screenshot(screenshot, filename, quality=quality)
         return f"📸 Screenshot saved as '{filename}'."
     except Exception as e:
         return f"❌ Failed to take screenshot: {e}"
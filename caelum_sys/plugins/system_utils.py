@@ -2,36 +2,49 @@
 System utilities plugin for power management and screen locking operations.
 """
 
-import os  # For executing system-level commands
+import subprocess  # For executing system-level commands without a shell
 
+from caelum_sys.plugins._shell import which
 from caelum_sys.registry import register_command
 
 
 @register_command("lock screen", safe=False)
 def lock_screen():
     """Lock the current Windows workstation."""
-    os.system("rundll32.exe user32.dll,LockWorkStation")
+    rundll32 = which("rundll32")
+    if rundll32 is None:
+        return "❌ Screen locking is only supported on Windows."
+    subprocess.run([rundll32, "user32.dll,LockWorkStation"], check=False)
     return "🔒 Screen locked."
 
 
 @register_command("shut down in 5 minutes", safe=False)
 def shutdown_timer():
     """Schedule a system shutdown in 5 minutes."""
-    os.system("shutdown /s /t 300")
+    shutdown = which("shutdown")
+    if shutdown is None:
+        return "❌ shutdown command not available on this system."
+    subprocess.run([shutdown, "/s", "/t", "300"], check=False)
     return "⏳ System will shut down in 5 minutes."
 
 
 @register_command("restart in 5 minutes", safe=False)
 def restart_timer():
     """Schedule a system restart in 5 minutes."""
-    os.system("shutdown /r /t 300")
+    shutdown = which("shutdown")
+    if shutdown is None:
+        return "❌ shutdown command not available on this system."
+    subprocess.run([shutdown, "/r", "/t", "300"], check=False)
     return "🔄 System will restart in 5 minutes."
 
 
 @register_command("hibernate", safe=False)
 def hibernate():
     """Put the system into hibernation mode."""
-    os.system("shutdown /h")
+    shutdown = which("shutdown")
+    if shutdown is None:
+        return "❌ shutdown command not available on this system."
+    subprocess.run([shutdown, "/h"], check=False)
     return "💤 System hibernated."
 
 
@@ -40,8 +53,11 @@ def hibernate():
 
 def _cancel_scheduled_shutdown():
     """Cancel any pending shutdown or restart."""
+    shutdown = which("shutdown")
+    if shutdown is None:
+        return "❌ shutdown command not available on this system."
     try:
-        result = os.system("shutdown /a")
+        result = subprocess.run([shutdown, "/a"], check=False).returncode
         if result == 0:
             return "✅ Scheduled shutdown/restart cancelled"
         else:
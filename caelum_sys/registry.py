@@ -1,8 +1,130 @@
 """Command Registry System for CaelumSys"""
 
+import importlib
+import inspect
+import re
+import sys
+
 # Global registry to store all registered commands
 registry = {}
 
+# Phrases containing {placeholders}; these never match as exact commands
+parameterized_phrases = set()
+
+# Matches {name} argument placeholders in command templates
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Cached tuple of registered phrases, rebuilt after the registry changes
+_phrases_snapshot = None
+
+# Callbacks run whenever commands are registered or cleared (e.g. cache resets)
+_change_callbacks = []
+
+
+def on_registry_change(callback):
+    """Run callback (with no arguments) whenever the registry is modified."""
+    _change_callbacks.append(callback)
+    return callback
+
+
+def _notify_registry_change():
+    global _phrases_snapshot
+    _phrases_snapshot = None
+    for callback in _change_callbacks:
+        callback()
+
+
+def command_pattern_source(trigger, capture=True):
+    """Translate a command template into regex source.
+
+    "copy {source} to {destination}" becomes a pattern with one lazy group
+    per placeholder, in order: capturing when capture is True, non-capturing
+    otherwise (for embedding in a larger alternation). Groups are positional
+    so repeated or numeric placeholder names can never break compilation.
+    """
+    parts = []
+    position = 0
+    for placeholder in _PLACEHOLDER_RE.finditer(trigger):
+        parts.append(re.escape(trigger[position : placeholder.start()]))
+        if capture:
+            parts.append("(.+?)")
+        else:
+            parts.append("(?:.+?)")
+        position = placeholder.end()
+    parts.append(re.escape(trigger[position:]))
+    return "".join(parts)
+
+
+def compile_command_pattern(trigger):
+    """Compile the argument-extraction regex for a template (None if no args).
+
+    Use it with .match(); like the old "^...$" pattern, "$" also accepts a
+    single trailing newline.
+    """
+    if not is_parameterized(trigger):
+        return None
+    return re.compile(command_pattern_source(trigger) + "$", re.IGNORECASE)
+
+
+def get_placeholder_names(trigger):
+    """Return the placeholder names of a command template, in order."""
+    return _PLACEHOLDER_RE.findall(trigger)
+
+
+def is_parameterized(trigger):
+    """Check whether a command phrase contains {placeholders}."""
+    return _PLACEHOLDER_RE.search(trigger) is not None
+
+
+def get_command_pattern(trigger):
+    """Get the compiled argument pattern for a command template.
+
+    Patterns are compiled once and stored on the registry entry; lazy
+    placeholders compile theirs on first use to keep package import fast.
+    """
+    command_data = registry.get(trigger)
+    if command_data is None:
+        return compile_command_pattern(trigger)
+    if "pattern" not in command_data:
+        command_data["pattern"] = compile_command_pattern(trigger)
+    return command_data["pattern"]
+
+
+class LazyCommand:
+    """Placeholder for a command whose plugin module hasn't been imported yet.
+
+    The first call imports the plugin, whose @register_command decorators
+    replace this placeholder with the real function, then re-dispatches.
+    """
+
+    def __init__(self, trigger, module_name):
+        self.trigger = trigger
+        self.module_name = module_name
+        # Keep per-plugin grouping (e.g. in "help") working before import
+        self.__module__ = module_name
+
+    def resolve(self):
+        """Import the plugin module and return the real command function."""
+        first_import = self.module_name not in sys.modules
+        module = importlib.import_module(self.module_name)
+        # Run the plugin's optional register() hook, as load_all_plugins does
+        if first_import and hasattr(module, "register"):
+            module.register()
+        func = registry.get(self.trigger, {}).get("func")
+        if func is None or func is self:
+            raise ImportError(
+                f"Plugin '{self.module_name}' did not register '{self.trigger}'"
+            )
+        return func
+
+    @property
+    def __signature__(self):
+        # Lets do() map template arguments onto the real function's parameters
+        return inspect.signature(self.resolve())
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
 
 def register_command(trigger, safe=True):
     """Decorator to register a command with the CaelumSys system.
@@ -13,12 +135,37 @@ def register_command(trigger, safe=True):
     """
 
     def wrapper(func):
-        registry[trigger.lower()] = {"func": func, "safe": safe}
+        # Interned keys let dict lookups short-circuit on identity
+        phrase = sys.intern(trigger.lower())
+        # Compiled now (reusing a lazy placeholder's pattern if it has one)
+        registry[phrase] = {
+            "func": func,
+            "safe": safe,
+            "pattern": get_command_pattern(phrase),
+        }
+        if is_parameterized(phrase):
+            parameterized_phrases.add(phrase)
+        _notify_registry_change()
         return func
 
     return wrapper
 
 
+def register_lazy_command(trigger, module_name, safe=True):
+    """Register a command phrase without importing the plugin that defines it.
+
+    Args:
+        trigger: The command phrase that triggers the command
+        module_name: Fully qualified name of the plugin module defining it
+        safe: Whether this command is safe to execute (default: True)
+    """
+    trigger = sys.intern(trigger.lower())
+    registry[trigger] = {"func": LazyCommand(trigger, module_name), "safe": safe}
+    if is_parameterized(trigger):
+        parameterized_phrases.add(trigger)
+    _notify_registry_change()
+
+
 def get_registered_command(command):
     """Retrieve a registered command function by its trigger phrase."""
     command_data = registry.get(command.lower(), {})
@@ -26,8 +173,15 @@ def get_registered_command(command):
 
 
 def get_registered_command_phrases():
-    """Get a list of all registered command phrases."""
-    return list(registry.keys())
+    """Get all registered command phrases as a tuple.
+
+    The tuple is cached and only rebuilt after commands are registered or
+    cleared, so repeated calls don't copy the registry.
+    """
+    global _phrases_snapshot
+    if _phrases_snapshot is None:
+        _phrases_snapshot = tuple(registry)
+    return _phrases_snapshot
 
 
 def get_safe_registry():
@@ -43,6 +197,8 @@ def clear_registry():
     """Clear all registered commands from the registry (mainly for testing)."""
     global registry
     registry.clear()
+    parameterized_phrases.clear()
+    _notify_registry_change()
 
 
 def get_registry_stats():